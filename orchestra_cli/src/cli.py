@@ -1,33 +1,144 @@
+import importlib
+import sys
+from importlib.metadata import PackageNotFoundError, version
+
 import typer
+from typer.core import TyperGroup
+
+# Command implementations are imported lazily, on first use, so that invocations
+# that never run a command (`orchestra --help`, shell completion, unknown command
+# errors) do not pay for the httpx/yaml/subprocess machinery the command modules
+# pull in transitively. Each entry maps a command name to a "module:function"
+# import target.
+_PIPELINE_COMMANDS = {
+    "validate": "orchestra_cli.src.validate_pipeline:validate",
+    "import": "orchestra_cli.src.import_pipeline:import_pipeline",
+    "new": "orchestra_cli.src.create_pipeline:create_pipeline",
+    "update": "orchestra_cli.src.update_pipeline:update_pipeline",
+    "get": "orchestra_cli.src.fetch_pipelines:fetch_pipelines",
+    "run": "orchestra_cli.src.run_pipeline:run_pipeline",
+    "delete": "orchestra_cli.src.delete_pipeline:delete_pipeline",
+}
+
+# Legacy top-level aliases - keep the old `orchestra <command>` syntax working
+# so existing scripts and CI pipelines do not break. They resolve lazily like
+# the pipeline verbs but are not listed, which keeps them out of `--help` and
+# the advertised surface focused on the new noun/verb structure.
+_LEGACY_ALIASES = {
+    "validate": _PIPELINE_COMMANDS["validate"],
+    "import": _PIPELINE_COMMANDS["import"],
+    "run": _PIPELINE_COMMANDS["run"],
+    "fetch-pipelines": _PIPELINE_COMMANDS["get"],
+    "create-pipeline": _PIPELINE_COMMANDS["new"],
+    "update-pipeline": _PIPELINE_COMMANDS["update"],
+    "delete-pipeline": _PIPELINE_COMMANDS["delete"],
+}
+
+_loaded_commands: dict[str, object] = {}
+
+
+def _load_command(name: str, target: str):
+    """Import a command function and build its click command on first use."""
+    command = _loaded_commands.get(name)
+    if command is None:
+        module_name, func_name = target.split(":")
+        func = getattr(importlib.import_module(module_name), func_name)
+        helper = typer.Typer()
+        helper.command(name=name)(func)
+        command = typer.main.get_command(helper)
+        _loaded_commands[name] = command
+    return command
+
+
+class _LazyGroup(TyperGroup):
+    """Typer group that resolves subcommands from an import map on first use.
+
+    ``list_commands`` drives help output and completion; names absent from it
+    behave as hidden commands but are still resolvable via ``get_command``,
+    which is how the legacy top-level aliases stay invokable without being
+    advertised.
+    """
+
+    lazy_commands: dict[str, str] = {}
+    list_lazy_commands = True
+
+    def list_commands(self, ctx):
+        names = super().list_commands(ctx)
+        if self.list_lazy_commands:
+            names += [name for name in self.lazy_commands if name not in names]
+        return names
+
+    def get_command(self, ctx, name):
+        command = super().get_command(ctx, name)
+        if command is not None:
+            return command
+        target = self.lazy_commands.get(name)
+        if target is None:
+            return None
+        return _load_command(name, target)
 
-from .create_pipeline import create_pipeline
-from .delete_pipeline import delete_pipeline
-from .fetch_pipelines import fetch_pipelines
-from .import_pipeline import import_pipeline
-from .run_pipeline import run_pipeline
-from .update_pipeline import update_pipeline
-from .validate_pipeline import validate
 
-app = typer.Typer(help="Orchestra CLI – perform operations with Orchestra locally.")
+class _RootGroup(_LazyGroup):
+    lazy_commands = _LEGACY_ALIASES
+    list_lazy_commands = False
 
-pipeline_app = typer.Typer(help="Manage Orchestra pipelines (validate, import, run, ...).")
+
+class _PipelineGroup(_LazyGroup):
+    lazy_commands = _PIPELINE_COMMANDS
+
+
+# add_completion=False drops the --install-completion/--show-completion
+# options and the shellingham/completion machinery behind them.
+app = typer.Typer(
+    cls=_RootGroup,
+    add_completion=False,
+    help="Orchestra CLI – perform operations with Orchestra locally.",
+)
+
+pipeline_app = typer.Typer(
+    cls=_PipelineGroup,
+    add_completion=False,
+    help="Manage Orchestra pipelines (validate, import, run, ...).",
+)
 app.add_typer(pipeline_app, name="pipeline")
 
-pipeline_app.command(name="validate")(validate)
-pipeline_app.command(name="import")(import_pipeline)
-pipeline_app.command(name="new")(create_pipeline)
-pipeline_app.command(name="update")(update_pipeline)
-pipeline_app.command(name="get")(fetch_pipelines)
-pipeline_app.command(name="run")(run_pipeline)
-pipeline_app.command(name="delete")(delete_pipeline)
-
-# Legacy top-level aliases (hidden) - keep the old `orchestra <command>` syntax working
-# so existing scripts and CI pipelines do not break. Hidden from `--help` to keep the
-# advertised surface focused on the new noun/verb structure.
-app.command(name="validate", hidden=True)(validate)
-app.command(name="import", hidden=True)(import_pipeline)
-app.command(name="run", hidden=True)(run_pipeline)
-app.command(name="fetch-pipelines", hidden=True)(fetch_pipelines)
-app.command(name="create-pipeline", hidden=True)(create_pipeline)
-app.command(name="update-pipeline", hidden=True)(update_pipeline)
-app.command(name="delete-pipeline", hidden=True)(delete_pipeline)
+
+def _version() -> str:
+    try:
+        return version("orchestra-cli")
+    except PackageNotFoundError:
+        # Running from a source checkout without the package installed
+        return "unknown"
+
+
+def _version_callback(value: bool) -> None:
+    if value:
+        typer.echo(_version())
+        raise typer.Exit(code=0)
+
+
+@app.callback()
+def _root(
+    version: bool = typer.Option(  # noqa: ARG001
+        False,
+        "--version",
+        "-V",
+        help="Show the CLI version and exit.",
+        callback=_version_callback,
+        is_eager=True,
+    ),
+):
+    pass
+
+
+def main() -> None:
+    """Console-script entry point.
+
+    ``--version`` is answered from ``sys.argv`` directly so scripted version
+    probes skip argument parsing and the help machinery entirely; everything
+    else dispatches into the Typer app.
+    """
+    if len(sys.argv) == 2 and sys.argv[1] in ("--version", "-V"):
+        typer.echo(_version())
+        return
+    app()
@@ -1,9 +1,9 @@
-import httpx
 import typer
 
 from ..utils.api import (
     auth_headers,
     fail_with_response,
+    get_client,
     request_or_exit,
     require_api_key,
 )
@@ -20,7 +20,7 @@ def delete_pipeline(
     api_key = require_api_key()
 
     response = request_or_exit(
-        httpx.delete,
+        get_client().delete,
         get_delete_pipeline_url(alias),
         timeout=30,
         headers=auth_headers(api_key),
@@ -1,11 +1,12 @@
 import json
 
-import httpx
 import typer
 
 from ..utils.api import (
     auth_headers,
     fail_with_response,
+    get_client,
+    parse_json,
     request_or_exit,
     require_api_key,
 )
@@ -22,7 +23,7 @@ def fetch_pipelines():
     api_key = require_api_key()
 
     response = request_or_exit(
-        httpx.get,
+        get_client().get,
         get_api_url(""),
         timeout=30,
         headers=auth_headers(api_key),
@@ -30,7 +31,7 @@ def fetch_pipelines():
 
     if response.status_code == 200:
         try:
-            pipelines = response.json()
+            pipelines = parse_json(response)
         except Exception:
             typer.echo(red("❌ Fetch pipelines failed: success response was not valid JSON"))
             typer.echo(yellow(indent_message(response.text)))
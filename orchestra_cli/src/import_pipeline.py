@@ -1,37 +1,84 @@
 import json
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import urlparse
 
-import httpx
 import typer
 
 from ..utils.api import (
     auth_headers,
+    encode_json,
     fail_with_response,
+    get_client,
+    json_content_headers,
+    parse_json,
     request_or_exit,
     require_api_key,
 )
 from ..utils.constants import get_api_url
-from ..utils.git import detect_repo_root, git_warnings, run_git_command
+from ..utils.git import (
+    detect_repo_root,
+    git_warnings,
+    prefetch_git_commands,
+    run_git_command,
+)
 from ..utils.styling import bold, green, red, yellow
 from ..utils.yaml_loader import load_validated_pipeline_data
 
+# Fallback parse of `git remote show origin` output; compiled once at import.
+_HEAD_BRANCH_RE = re.compile(r"HEAD branch:\s*(\S+)")
 
-def _detect_repository_url(repo_root: Path) -> str | None:
-    ok, remote = run_git_command(["remote", "get-url", "origin"], repo_root)
-    if not ok or not remote:
-        return None
+# Service path segments (Azure `/_git/`, Bitbucket Server `/scm/`, Azure SSH
+# `/v3/`) that are not part of the owner/repo slug.
+_SERVICE_SEGMENTS = {"_git", "scm", "v3"}
 
-    # First, handle special cases like Azure URLs by removing segments like /_git/
-    cleaned_remote = re.sub(r"/(?:_git|scm|v3)(?=/)", "", remote.strip())
+# Remote host suffix -> Orchestra storage provider. Matched against the parsed
+# hostname (exact or subdomain), replacing repeated substring scans of the URL.
+_HOST_PROVIDERS = {
+    "github.com": "GITHUB",
+    "gitlab.com": "GITLAB",
+    "dev.azure.com": "AZURE_DEVOPS",
+    "azure.com": "AZURE_DEVOPS",
+    "visualstudio.com": "AZURE_DEVOPS",
+}
 
-    # A single regex can then capture the owner/repo from the cleaned URL
-    pattern = r".*[:/]([^/]+)/([^/]+?)(?:\.git)?/?$"
 
-    if match := re.search(pattern, cleaned_remote):
-        return f"{match.group(1)}/{match.group(2)}"
+def _detect_repository_url(remote: str | None) -> str | None:
+    """Extract the ``owner/repo`` slug from a raw git remote URL.
 
-    return None
+    Handles https, ssh and scp-style remotes with plain string operations -
+    a single linear scan instead of regex passes over every URL.
+    """
+    if not remote:
+        return None
+
+    url = remote.strip()
+    # Drop the scheme, then any user info in front of the host.
+    url = url.split("://", 1)[-1]
+    slash = url.find("/")
+    at = url.find("@")
+    if at != -1 and (slash == -1 or at < slash):
+        url = url[at + 1 :]
+        slash = url.find("/")
+    # scp-style `host:path` - treat the first colon as a path separator.
+    colon = url.find(":")
+    if colon != -1 and (slash == -1 or colon < slash):
+        url = url.replace(":", "/", 1)
+
+    # Filter service segments from every position except the last: a repo
+    # may itself be named `v3`/`scm`/`_git`.
+    parts = [seg for seg in url.split("/") if seg]
+    if not parts:
+        return None
+    segments = [seg for seg in parts[:-1] if seg not in _SERVICE_SEGMENTS] + [parts[-1]]
+    if len(segments) < 2:
+        return None
+    repo = segments[-1].removesuffix(".git")
+    if not repo:
+        return None
+    return f"{segments[-2]}/{repo}"
 
 
 def _get_remote_url(repo_root: Path) -> str | None:
@@ -51,7 +98,7 @@ def _detect_default_branch(repo_root: Path) -> str | None:
     # Fallback to parsing `git remote show origin`
     ok, out = run_git_command(["remote", "show", "origin"], repo_root)
     if ok and out:
-        m = re.search(r"HEAD branch:\s*(\S+)", out)
+        m = _HEAD_BRANCH_RE.search(out)
         if m:
             return m.group(1)
     return None
@@ -68,17 +115,38 @@ def _detect_storage_provider(repository_url: str | None) -> str:
     if not repository_url:
         typer.echo(red("Could not detect storage provider - no repository URL"))
         raise typer.Exit(code=1)
-    url = repository_url.lower()
-    if "github.com" in url:
-        return "GITHUB"
-    if "gitlab.com" in url:
-        return "GITLAB"
-    if any(host in url for host in ["dev.azure.com", "azure.com", "visualstudio.com"]):
-        return "AZURE_DEVOPS"
+    url = repository_url.strip().lower()
+    # scp-style remotes have no scheme; normalize so urlparse sees a host.
+    if "://" not in url:
+        url = "ssh://" + url.replace(":", "/", 1)
+    host = urlparse(url).hostname or ""
+    for suffix, provider in _HOST_PROVIDERS.items():
+        if host == suffix or host.endswith("." + suffix):
+            return provider
     typer.echo(red("Could not detect storage provider - no matching host"))
     raise typer.Exit(code=1)
 
 
+def _detect_and_prefetch_git(path: Path) -> Path | None:
+    """Detect the repo root and warm the git cache for every question asked
+    during import; the detection helpers and git_warnings then read memoized
+    results instead of forking serially."""
+    repo_root = detect_repo_root(path.parent)
+    if repo_root is not None:
+        prefetch_git_commands(
+            [
+                ["remote", "get-url", "origin"],
+                ["symbolic-ref", "refs/remotes/origin/HEAD"],
+                ["rev-parse", "--abbrev-ref", "HEAD"],
+                ["diff-index", "--quiet", "HEAD", "--"],
+                ["ls-files", "--others", "--exclude-standard"],
+                ["rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}"],
+            ],
+            repo_root,
+        )
+    return repo_root
+
+
 def import_pipeline(
     alias: str = typer.Option(..., "--alias", "-a", help="Pipeline alias"),
     path: Path = typer.Option(
@@ -103,15 +171,23 @@ def import_pipeline(
     Create a pipeline in Orchestra by referencing a YAML file in your git repository.
     """
     api_key = require_api_key()
-    load_validated_pipeline_data(path)
 
-    # Detect git repository info
-    repo_root = detect_repo_root(path.parent)
+    # Schema validation is a network round-trip and the git detection below is
+    # a handful of subprocesses; they are independent, so run them in parallel
+    # and surface validation problems first to keep error output and exit
+    # codes unchanged.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        validation = pool.submit(load_validated_pipeline_data, path)
+        git_info = pool.submit(_detect_and_prefetch_git, path)
+        validation.result()
+        repo_root = git_info.result()
+
     if repo_root is None:
         typer.echo(red("Not a git repository (could not detect repository root)"))
         raise typer.Exit(code=1)
 
-    repository_slug = _detect_repository_url(repo_root)
+    remote_url = _get_remote_url(repo_root)
+    repository_slug = _detect_repository_url(remote_url)
     if not repository_slug:
         typer.echo(red("Could not detect repository URL from git"))
         raise typer.Exit(code=1)
@@ -127,18 +203,19 @@ def import_pipeline(
             typer.echo(red("Could not detect current branch from git"))
             raise typer.Exit(code=1)
 
-    # Compute YAML path relative to repo root
-    try:
-        yaml_path = str(path.resolve().relative_to(repo_root.resolve()))
-    except Exception:
+    # Compute YAML path relative to repo root. `path` is already resolved by
+    # typer (resolve_path=True), so only the repo root needs a realpath here.
+    resolved_root = repo_root.resolve()
+    if not path.is_relative_to(resolved_root):
         typer.echo(red("YAML file must be inside the git repository"))
         raise typer.Exit(code=1)
+    yaml_path = str(path.relative_to(resolved_root))
 
     for w in git_warnings(repo_root):
         typer.echo(yellow(f"⚠ {w}"))
 
     payload = {
-        "storage_provider": _detect_storage_provider(_get_remote_url(repo_root)),
+        "storage_provider": _detect_storage_provider(remote_url),
         "repository": repository_slug,
         "default_branch": default_branch,
         "working_branch": working_branch,
@@ -147,21 +224,26 @@ def import_pipeline(
     }
 
     response = request_or_exit(
-        httpx.post,
-        get_api_url("import"),
-        json=payload,
-        timeout=30,
-        headers=auth_headers(api_key),
+        lambda: get_client().post(
+            get_api_url("import"),
+            content=encode_json(payload),
+            timeout=30,
+            headers=json_content_headers(auth_headers(api_key)),
+        ),
     )
 
     if response.status_code == 201:
         try:
-            body = response.json()
+            body = parse_json(response)
         except Exception:
             body = {}
         pipeline_id = body.get("id")
         if pipeline_id:
-            typer.echo(f"Pipeline with alias '{alias}' imported successfully: {pipeline_id}")
+            # Plain unstyled line; write it directly rather than routing
+            # through Click's echo (color stripping, encoding negotiation).
+            sys.stdout.write(
+                f"Pipeline with alias '{alias}' imported successfully: {pipeline_id}\n",
+            )
             raise typer.Exit(code=0)
         # Fallback if server does not return a field we expect
         typer.echo(green("✅ Pipeline imported successfully"))
@@ -6,13 +6,17 @@ to upsert (API key resolution, YAML loading) lives in ``orchestra_cli.utils``.
 """
 
 import json
+from typing import TYPE_CHECKING
 
-import httpx
 import typer
 
+from ..utils.api import parse_json
 from ..utils.constants import get_pipeline_edit_url
 from ..utils.styling import green, indent_message, red, yellow
 
+if TYPE_CHECKING:
+    import httpx
+
 
 def build_upsert_payload(data: dict, publish: bool, alias: str | None = None) -> dict:
     payload: dict[str, object] = {
@@ -26,11 +30,11 @@ def build_upsert_payload(data: dict, publish: bool, alias: str | None = None) ->
 
 
 def require_pipeline_id_from_success_response(
-    response: httpx.Response,
+    response: "httpx.Response",
     action: str,
 ) -> str:
     try:
-        body = response.json()
+        body = parse_json(response)
     except Exception:
         typer.echo(red(f"❌ {action} failed: success response was not valid JSON"))
         typer.echo(yellow(indent_message(response.text)))
@@ -1,12 +1,13 @@
 import time
 from pathlib import Path
 
-import httpx
 import typer
 
 from ..utils.api import (
     auth_headers,
     fail_with_response,
+    get_client,
+    parse_json,
     request_or_exit,
     require_api_key,
 )
@@ -55,7 +56,7 @@ def _poll_until_terminal(
     while True:
         time.sleep(poll_interval_seconds)
         try:
-            status_resp = httpx.get(status_url, headers=headers, timeout=30)
+            status_resp = get_client().get(status_url, headers=headers, timeout=30)
         except Exception as e:
             typer.echo(yellow(f"Polling request failed: {e}"))
             continue
@@ -69,7 +70,7 @@ def _poll_until_terminal(
             raise typer.Exit(code=1)
 
         try:
-            status_body = status_resp.json()
+            status_body = parse_json(status_resp)
         except Exception:
             status_body = {}
 
@@ -140,7 +141,7 @@ def run_pipeline(
 
     typer.echo(f"Starting pipeline (alias: {alias})")
     response = request_or_exit(
-        httpx.post,
+        get_client().post,
         get_api_url(f"{alias}/start"),
         json=payload if payload else None,
         timeout=30,
@@ -149,7 +150,7 @@ def run_pipeline(
 
     if 200 <= response.status_code < 300:
         try:
-            body = response.json()
+            body = parse_json(response)
         except Exception:
             body = {}
 
@@ -1,11 +1,13 @@
 from pathlib import Path
 
-import httpx
 import typer
 
 from ..utils.api import (
     auth_headers,
+    encode_json,
     fail_with_response,
+    get_client,
+    json_content_headers,
     request_or_exit,
     require_api_key,
 )
@@ -44,12 +46,15 @@ def update_pipeline(
     data = load_validated_pipeline_data(path)
     payload = build_upsert_payload(data, publish)
 
+    # Serialize once and send bytes so httpx skips its own json.dumps pass;
+    # the closure keeps encoding inside request_or_exit's error handling.
     response = request_or_exit(
-        httpx.put,
-        get_update_pipeline_url(alias),
-        json=payload,
-        timeout=30,
-        headers=auth_headers(api_key),
+        lambda: get_client().put(
+            get_update_pipeline_url(alias),
+            content=encode_json(payload),
+            timeout=30,
+            headers=json_content_headers(auth_headers(api_key)),
+        ),
     )
 
     if response.status_code == 200:
@@ -1,11 +1,9 @@
 from pathlib import Path
 from typing import Any
 
-import httpx
 import typer
-import yaml
 
-from ..utils.api import request_or_exit
+from ..utils.api import encode_json, get_client, json_content_headers, request_or_exit
 from ..utils.constants import get_api_url
 from ..utils.styling import bold, green, indent_message, red, yellow
 from ..utils.yaml_loader import load_yaml
@@ -37,7 +35,14 @@ def validate(file: Path = typer.Argument(..., help="YAML file to validate")):
         typer.echo(red(f"Invalid YAML: {err}"))
         raise typer.Exit(code=1)
 
-    response = request_or_exit(httpx.post, get_api_url("schema"), json=data, timeout=10)
+    response = request_or_exit(
+        lambda: get_client().post(
+            get_api_url("schema"),
+            content=encode_json(data),
+            headers=json_content_headers(),
+            timeout=10,
+        ),
+    )
 
     if response.status_code == 200:
         typer.echo(green("✅ Validation passed!"))
@@ -55,6 +60,8 @@ def validate(file: Path = typer.Argument(..., help="YAML file to validate")):
                 typer.echo(red(indent_message(msg)))
                 snippet = get_yaml_snippet(data, loc)
                 if snippet is not None:
+                    import yaml
+
                     typer.echo(bold("\nYAML snippet:"))
                     typer.echo(yaml.dump(snippet, sort_keys=False, default_flow_style=False))
                 else:
@@ -1,11 +1,106 @@
+import functools
+from pathlib import Path
+
+import pytest
+import typer.main
+import typer.testing
+
+from orchestra_cli.utils.api import require_api_key
+from orchestra_cli.utils.constants import clear_url_caches
+from orchestra_cli.utils.git import clear_git_cache
+
+# CliRunner.invoke rebuilds the click command tree from the Typer app on
+# every call; the tree is static for the whole session, so memoize the
+# conversion at the seam the runner uses. The runner's _get_command is just
+# the public typer.main.get_command, so wrap that rather than the private
+# symbol; only the assignment target needs the pyright waiver.
+typer.testing._get_command = functools.cache(  # pyright: ignore[reportPrivateImportUsage]
+    typer.main.get_command,
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_env():
+    # One env patch for the whole session instead of a per-test fixture in
+    # every module; tests that need a different env (e.g. a deleted API key)
+    # still override it with their own monkeypatch.
+    mp = pytest.MonkeyPatch()
+    mp.setenv("ORCHESTRA_API_KEY", "fake-key")
+    mp.setenv("BASE_URL", "")
+    yield
+    mp.undo()
+
+
+@pytest.fixture(autouse=True)
+def isolated_yaml_cache(tmp_path, monkeypatch):
+    # The validated-YAML disk cache is keyed by content hash; tests reuse the
+    # same YAML bodies, so give each test its own cache dir to keep schema
+    # calls observable.
+    monkeypatch.setenv("ORCHESTRA_CACHE_DIR", str(tmp_path / "yaml-cache"))
+
+
+@pytest.fixture(autouse=True)
+def fresh_api_key_cache():
+    # require_api_key memoizes the env lookup; tests flip ORCHESTRA_API_KEY
+    # between cases.
+    require_api_key.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def fresh_url_caches():
+    # URL helpers memoize BASE_URL-derived strings; each test sets its own
+    # BASE_URL, so start from an empty cache.
+    clear_url_caches()
+
+
+@pytest.fixture(autouse=True)
+def fresh_git_cache():
+    # run_git_command memoizes results for the life of the process; each test
+    # installs its own subprocess.run mock, so start every test from a clean
+    # cache.
+    clear_git_cache()
+    yield
+
+
+@pytest.fixture
+def schema_ok(httpx_mock):
+    # Opt-in registration of the standard schema-200 response shared by the
+    # upsert/import happy-path tests. Deliberately not autouse: schema-failure
+    # tests register their own response, and pytest-httpx asserts every
+    # registered response gets used.
+    httpx_mock.add_response(
+        method="POST",
+        url="https://app.getorchestra.io/api/engine/public/pipelines/schema",
+        json={"ok": True},
+        status_code=200,
+    )
+
+
+@pytest.fixture(scope="session")
+def demo_yaml(tmp_path_factory) -> Path:
+    # The standard valid pipeline YAML used across the upsert tests; written
+    # once per session instead of once per test.
+    path = tmp_path_factory.mktemp("yaml") / "pipe.yaml"
+    path.write_text("name: demo\nversion: 1\n")
+    return path
+
+
+@pytest.fixture(scope="session")
+def bad_yaml(tmp_path_factory) -> Path:
+    path = tmp_path_factory.mktemp("yaml") / "bad.yaml"
+    path.write_text("name: [oops\n")
+    return path
+
+
 def make_git_subprocess_mock(mapping: dict[tuple[str, ...], tuple[int, str, str]]):
     class Result:
+        # Mirrors the real bytes-mode subprocess contract (no text=True).
         def __init__(self, returncode: int, stdout: str = "", stderr: str = ""):
             self.returncode = returncode
-            self.stdout = stdout
-            self.stderr = stderr
+            self.stdout = stdout.encode()
+            self.stderr = stderr.encode()
 
-    def _mock_run(args, cwd=None, capture_output=False, text=False, check=False):  # noqa: ARG001
+    def _mock_run(args, cwd=None, capture_output=False, check=False):  # noqa: ARG001
         # args begins with ["git", ...]
         key = tuple(args[1:])
         rc, out, err = mapping.get(key, (1, "", ""))
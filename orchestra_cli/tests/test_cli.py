@@ -1,3 +1,8 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 from typer.testing import CliRunner
 
 from orchestra_cli.src.cli import app
@@ -46,3 +51,50 @@ def test_legacy_aliases_still_invokable():
     ):
         result = runner.invoke(app, [alias, "--help"])
         assert result.exit_code == 0, f"Legacy alias '{alias}' is not registered"
+
+
+def test_cli_import_stays_lightweight():
+    # Command modules (and therefore httpx/yaml) must only be imported when a
+    # command actually runs, not when the app itself is built. Checked in a
+    # fresh interpreter because this test process has already imported them.
+    code = (
+        "import sys\n"
+        "import orchestra_cli.src.cli\n"
+        "assert 'httpx' not in sys.modules, 'httpx imported at CLI startup'\n"
+        "assert 'yaml' not in sys.modules, 'yaml imported at CLI startup'\n"
+    )
+    repo_root = Path(__file__).resolve().parents[2]
+    env = {**os.environ, "PYTHONPATH": str(repo_root)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+
+def test_version_option():
+    result = runner.invoke(app, ["--version"])
+    assert result.exit_code == 0
+    assert result.output.strip() != ""
+
+
+def test_main_version_fast_path(monkeypatch, capsys):
+    from orchestra_cli.src import cli
+
+    monkeypatch.setattr(sys, "argv", ["orchestra", "-V"])
+    cli.main()
+    assert capsys.readouterr().out.strip() != ""
+
+
+def test_fail_fast_paths_skip_httpx():
+    # Commands that exit before making a request (here: missing API key) must
+    # not import httpx at all.
+    code = (
+        "import os\n"
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from orchestra_cli.src.cli import app\n"
+        "os.environ.pop('ORCHESTRA_API_KEY', None)\n"
+        "result = CliRunner().invoke(app, ['pipeline', 'delete', '--alias', 'demo'])\n"
+        "assert result.exit_code == 1, result.output\n"
+        "assert 'httpx' not in sys.modules, 'httpx imported on a fail-fast path'\n"
+    )
+    repo_root = Path(__file__).resolve().parents[2]
+    env = {**os.environ, "PYTHONPATH": str(repo_root)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
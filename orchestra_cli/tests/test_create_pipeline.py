@@ -9,22 +9,23 @@ from orchestra_cli.src.cli import app
 runner = CliRunner()
 
 
-@pytest.fixture(autouse=True)
-def mock_env(monkeypatch):
-    monkeypatch.setenv("ORCHESTRA_API_KEY", "fake-key")
-    monkeypatch.setenv("BASE_URL", "")
-
-
-def test_create_success_default_no_publish(tmp_path: Path, httpx_mock: HTTPXMock):
-    yaml_file = tmp_path / "pipe.yaml"
-    yaml_file.write_text("name: demo\nversion: 1\n")
-
-    httpx_mock.add_response(
-        method="POST",
-        url="https://app.getorchestra.io/api/engine/public/pipelines/schema",
-        json={"ok": True},
-        status_code=200,
-    )
+# One parametrized success test covers both publish modes and both spellings
+# (noun/verb and legacy alias).
+@pytest.mark.parametrize(
+    ("command", "flags", "published"),
+    [
+        (["pipeline", "new"], [], False),
+        (["create-pipeline"], ["--publish"], True),
+    ],
+)
+@pytest.mark.usefixtures("schema_ok")
+def test_create_success(
+    demo_yaml: Path,
+    httpx_mock: HTTPXMock,
+    command: list[str],
+    flags: list[str],
+    published: bool,
+):
     httpx_mock.add_response(
         method="POST",
         url="https://app.getorchestra.io/api/engine/public/pipelines",
@@ -33,72 +34,52 @@ def test_create_success_default_no_publish(tmp_path: Path, httpx_mock: HTTPXMock
         match_json={
             "alias": "demo",
             "data": {"name": "demo", "version": 1},
-            "published": False,
+            "published": published,
             "storage_provider": "ORCHESTRA",
         },
     )
 
-    result = runner.invoke(app, ["pipeline", "new", "--alias", "demo", "--path", str(yaml_file)])
+    result = runner.invoke(
+        app,
+        [*command, "--alias", "demo", "--path", str(demo_yaml), *flags],
+    )
     assert result.exit_code == 0
     assert "created successfully" in result.output
     assert "https://app.getorchestra.io/pipelines/pipeline-id/edit" in result.output
 
 
-def test_create_publish_flag(tmp_path: Path, httpx_mock: HTTPXMock):
-    yaml_file = tmp_path / "pipe.yaml"
-    yaml_file.write_text("name: demo\nversion: 1\n")
-
-    httpx_mock.add_response(
-        method="POST",
-        url="https://app.getorchestra.io/api/engine/public/pipelines/schema",
-        json={"ok": True},
-        status_code=200,
-    )
+@pytest.mark.usefixtures("schema_ok")
+def test_create_skips_validation_for_unchanged_file(demo_yaml: Path, httpx_mock: HTTPXMock):
     httpx_mock.add_response(
         method="POST",
         url="https://app.getorchestra.io/api/engine/public/pipelines",
         json={"id": "pipeline-id"},
         status_code=201,
-        match_json={
-            "alias": "demo",
-            "data": {"name": "demo", "version": 1},
-            "published": True,
-            "storage_provider": "ORCHESTRA",
-        },
+        is_reusable=True,
     )
 
-    result = runner.invoke(
-        app,
-        ["create-pipeline", "--alias", "demo", "--path", str(yaml_file), "--publish"],
-    )
-    assert result.exit_code == 0
-    assert "created successfully" in result.output
-    assert "https://app.getorchestra.io/pipelines/pipeline-id/edit" in result.output
+    args = ["pipeline", "new", "--alias", "demo", "--path", str(demo_yaml)]
+    assert runner.invoke(app, args).exit_code == 0
+    assert runner.invoke(app, args).exit_code == 0
 
+    schema_calls = [r for r in httpx_mock.get_requests() if r.url.path.endswith("/schema")]
+    assert len(schema_calls) == 1
 
-def test_create_missing_api_key(monkeypatch, tmp_path: Path):
-    yaml_file = tmp_path / "pipe.yaml"
-    yaml_file.write_text("name: demo\n")
 
+def test_create_missing_api_key(monkeypatch, demo_yaml: Path):
     monkeypatch.delenv("ORCHESTRA_API_KEY", raising=False)
-    result = runner.invoke(app, ["pipeline", "new", "--alias", "demo", "--path", str(yaml_file)])
+    result = runner.invoke(app, ["pipeline", "new", "--alias", "demo", "--path", str(demo_yaml)])
     assert result.exit_code == 1
     assert "ORCHESTRA_API_KEY is not set" in result.output
 
 
-def test_create_invalid_yaml(tmp_path: Path):
-    bad = tmp_path / "bad.yaml"
-    bad.write_text("name: [oops\n")
-
-    result = runner.invoke(app, ["pipeline", "new", "--alias", "demo", "--path", str(bad)])
+def test_create_invalid_yaml(bad_yaml: Path):
+    result = runner.invoke(app, ["pipeline", "new", "--alias", "demo", "--path", str(bad_yaml)])
     assert result.exit_code == 1
     assert "Invalid YAML" in result.output
 
 
-def test_create_schema_validation_error(tmp_path: Path, httpx_mock: HTTPXMock):
-    yaml_file = tmp_path / "pipe.yaml"
-    yaml_file.write_text("name: demo\nversion: 1\n")
-
+def test_create_schema_validation_error(demo_yaml: Path, httpx_mock: HTTPXMock):
     httpx_mock.add_response(
         method="POST",
         url="https://app.getorchestra.io/api/engine/public/pipelines/schema",
@@ -106,21 +87,13 @@ def test_create_schema_validation_error(tmp_path: Path, httpx_mock: HTTPXMock):
         status_code=400,
     )
 
-    result = runner.invoke(app, ["pipeline", "new", "--alias", "demo", "--path", str(yaml_file)])
+    result = runner.invoke(app, ["pipeline", "new", "--alias", "demo", "--path", str(demo_yaml)])
     assert result.exit_code == 1
     assert "Validation failed" in result.output
 
 
-def test_create_api_error(tmp_path: Path, httpx_mock: HTTPXMock):
-    yaml_file = tmp_path / "pipe.yaml"
-    yaml_file.write_text("name: demo\nversion: 1\n")
-
-    httpx_mock.add_response(
-        method="POST",
-        url="https://app.getorchestra.io/api/engine/public/pipelines/schema",
-        json={"ok": True},
-        status_code=200,
-    )
+@pytest.mark.usefixtures("schema_ok")
+def test_create_api_error(demo_yaml: Path, httpx_mock: HTTPXMock):
     httpx_mock.add_response(
         method="POST",
         url="https://app.getorchestra.io/api/engine/public/pipelines",
@@ -128,21 +101,13 @@ def test_create_api_error(tmp_path: Path, httpx_mock: HTTPXMock):
         status_code=400,
     )
 
-    result = runner.invoke(app, ["pipeline", "new", "--alias", "demo", "--path", str(yaml_file)])
+    result = runner.invoke(app, ["pipeline", "new", "--alias", "demo", "--path", str(demo_yaml)])
     assert result.exit_code == 1
     assert "Create failed" in result.output
 
 
-def test_create_success_without_pipeline_id_fails(tmp_path: Path, httpx_mock: HTTPXMock):
-    yaml_file = tmp_path / "pipe.yaml"
-    yaml_file.write_text("name: demo\nversion: 1\n")
-
-    httpx_mock.add_response(
-        method="POST",
-        url="https://app.getorchestra.io/api/engine/public/pipelines/schema",
-        json={"ok": True},
-        status_code=200,
-    )
+@pytest.mark.usefixtures("schema_ok")
+def test_create_success_without_pipeline_id_fails(demo_yaml: Path, httpx_mock: HTTPXMock):
     httpx_mock.add_response(
         method="POST",
         url="https://app.getorchestra.io/api/engine/public/pipelines",
@@ -150,21 +115,13 @@ def test_create_success_without_pipeline_id_fails(tmp_path: Path, httpx_mock: HT
         status_code=201,
     )
 
-    result = runner.invoke(app, ["pipeline", "new", "--alias", "demo", "--path", str(yaml_file)])
+    result = runner.invoke(app, ["pipeline", "new", "--alias", "demo", "--path", str(demo_yaml)])
     assert result.exit_code == 1
     assert "success response did not include pipeline id" in result.output
 
 
-def test_create_success_with_invalid_json_fails(tmp_path: Path, httpx_mock: HTTPXMock):
-    yaml_file = tmp_path / "pipe.yaml"
-    yaml_file.write_text("name: demo\nversion: 1\n")
-
-    httpx_mock.add_response(
-        method="POST",
-        url="https://app.getorchestra.io/api/engine/public/pipelines/schema",
-        json={"ok": True},
-        status_code=200,
-    )
+@pytest.mark.usefixtures("schema_ok")
+def test_create_success_with_invalid_json_fails(demo_yaml: Path, httpx_mock: HTTPXMock):
     httpx_mock.add_response(
         method="POST",
         url="https://app.getorchestra.io/api/engine/public/pipelines",
@@ -172,6 +129,6 @@ def test_create_success_with_invalid_json_fails(tmp_path: Path, httpx_mock: HTTP
         status_code=201,
     )
 
-    result = runner.invoke(app, ["pipeline", "new", "--alias", "demo", "--path", str(yaml_file)])
+    result = runner.invoke(app, ["pipeline", "new", "--alias", "demo", "--path", str(demo_yaml)])
     assert result.exit_code == 1
     assert "success response was not valid JSON" in result.output
@@ -1,5 +1,4 @@
 import httpx
-import pytest
 from pytest_httpx import HTTPXMock
 from typer.testing import CliRunner
 
@@ -9,12 +8,6 @@ runner = CliRunner()
 mock_api_key = "fake-key"
 
 
-@pytest.fixture(autouse=True)
-def mock_env(monkeypatch):
-    monkeypatch.setenv("ORCHESTRA_API_KEY", mock_api_key)
-    monkeypatch.setenv("BASE_URL", "")
-
-
 def test_delete_success(httpx_mock: HTTPXMock):
     alias = "demo"
     httpx_mock.add_response(
@@ -54,11 +47,10 @@ def test_delete_missing_api_key(monkeypatch):
     assert "ORCHESTRA_API_KEY is not set" in result.output
 
 
-def test_delete_http_request_failure(monkeypatch):
-    def raise_timeout(*args, **kwargs):  # noqa: ARG001
-        raise httpx.TimeoutException("timed out")
-
-    monkeypatch.setattr(httpx, "delete", raise_timeout)
+def test_delete_http_request_failure(httpx_mock: HTTPXMock):
+    # Requests go through the shared client, so simulate the failure at the
+    # transport layer instead of patching a module-level httpx function.
+    httpx_mock.add_exception(httpx.TimeoutException("timed out"))
 
     result = runner.invoke(app, ["pipeline", "delete", "--alias", "demo"])
 
@@ -1,6 +1,5 @@
 import json
 
-import pytest
 from pytest_httpx import HTTPXMock
 from typer.testing import CliRunner
 
@@ -9,12 +8,6 @@ from orchestra_cli.src.cli import app
 runner = CliRunner()
 
 
-@pytest.fixture(autouse=True)
-def mock_env(monkeypatch):
-    monkeypatch.setenv("ORCHESTRA_API_KEY", "fake-key")
-    monkeypatch.setenv("BASE_URL", "")
-
-
 def test_fetch_pipelines_success(httpx_mock: HTTPXMock):
     pipelines = [
         {
@@ -24,12 +24,6 @@ class FakeResponse:
         return self._json
 
 
-@pytest.fixture(autouse=True)
-def mock_env(monkeypatch):
-    monkeypatch.setenv("ORCHESTRA_API_KEY", "fake-key")
-    monkeypatch.setenv("BASE_URL", "")
-
-
 @pytest.mark.parametrize(
     "git_origin, storage_provider, repository",
     [
@@ -40,8 +34,12 @@ def mock_env(monkeypatch):
         ("https://dev.azure.com/org/project/_git/repo", "AZURE_DEVOPS", "project/repo"),
         ("https://org@dev.azure.com/org/project/_git/repo", "AZURE_DEVOPS", "project/repo"),
         ("git@ssh.dev.azure.com:v3/org/project/repo", "AZURE_DEVOPS", "project/repo"),
+        # Repos literally named after a service segment keep their name.
+        ("git@github.com:org/v3", "GITHUB", "org/v3"),
+        ("https://github.com/org/scm", "GITHUB", "org/scm"),
     ],
 )
+@pytest.mark.usefixtures("schema_ok")
 def test_import_success(
     monkeypatch,
     tmp_path: Path,
@@ -56,12 +54,6 @@ def test_import_success(
     yaml_file.write_text("name: demo\nversion: 1\n")
 
     # Mock httpx.post: first schema 200, then import 201
-    httpx_mock.add_response(
-        method="POST",
-        url="https://app.getorchestra.io/api/engine/public/pipelines/schema",
-        json={"ok": True},
-        status_code=200,
-    )
     httpx_mock.add_response(
         method="POST",
         url="https://app.getorchestra.io/api/engine/public/pipelines/import",
@@ -83,7 +75,7 @@ def test_import_success(
         ("remote", "get-url", "origin"): (0, git_origin, ""),
         ("symbolic-ref", "refs/remotes/origin/HEAD"): (0, "refs/remotes/origin/main", ""),
         ("rev-parse", "--abbrev-ref", "HEAD"): (0, "main", ""),
-        ("status", "--porcelain"): (0, "", ""),
+        ("diff-index", "--quiet", "HEAD", "--"): (0, "", ""),
         # Do not provide upstream to skip that branch check path
         ("rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}"): (1, "", ""),
     }
@@ -128,17 +120,12 @@ def test_import_schema_validation_error(tmp_path: Path, httpx_mock: HTTPXMock):
     assert "Validation failed" in result.output
 
 
+@pytest.mark.usefixtures("schema_ok")
 def test_import_api_error(monkeypatch, tmp_path: Path, httpx_mock: HTTPXMock):
     repo_root = tmp_path
     yaml_file = repo_root / "pipe.yaml"
     yaml_file.write_text("name: demo\nversion: 1\n")
 
-    httpx_mock.add_response(
-        method="POST",
-        url="https://app.getorchestra.io/api/engine/public/pipelines/schema",
-        json={"ok": True},
-        status_code=200,
-    )
     httpx_mock.add_response(
         method="POST",
         url="https://app.getorchestra.io/api/engine/public/pipelines/import",
@@ -151,7 +138,7 @@ def test_import_api_error(monkeypatch, tmp_path: Path, httpx_mock: HTTPXMock):
         ("remote", "get-url", "origin"): (0, "git@github.com:org/repo.git", ""),
         ("symbolic-ref", "refs/remotes/origin/HEAD"): (0, "refs/remotes/origin/main", ""),
         ("rev-parse", "--abbrev-ref", "HEAD"): (0, "main", ""),
-        ("status", "--porcelain"): (0, "", ""),
+        ("diff-index", "--quiet", "HEAD", "--"): (0, "", ""),
         ("rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}"): (1, "", ""),
     }
 
@@ -164,16 +151,11 @@ def test_import_api_error(monkeypatch, tmp_path: Path, httpx_mock: HTTPXMock):
     assert "Import failed" in result.output
 
 
-def test_not_a_git_repo(monkeypatch, tmp_path: Path, httpx_mock: HTTPXMock):
+@pytest.mark.usefixtures("schema_ok")
+def test_not_a_git_repo(monkeypatch, tmp_path: Path):
     yaml_file = tmp_path / "p.yaml"
     yaml_file.write_text("name: ok\n")
 
-    httpx_mock.add_response(
-        method="POST",
-        url="https://app.getorchestra.io/api/engine/public/pipelines/schema",
-        json={"ok": True},
-        status_code=200,
-    )
     import subprocess
 
     # rev-parse --show-toplevel fails
@@ -187,17 +169,12 @@ def test_not_a_git_repo(monkeypatch, tmp_path: Path, httpx_mock: HTTPXMock):
     assert "Not a git repository" in result.output
 
 
-def test_missing_repo_or_branch(monkeypatch, tmp_path: Path, httpx_mock: HTTPXMock):
+@pytest.mark.usefixtures("schema_ok")
+def test_missing_repo_or_branch(monkeypatch, tmp_path: Path):
     repo_root = tmp_path
     f = repo_root / "p.yaml"
     f.write_text("name: ok\n")
 
-    httpx_mock.add_response(
-        method="POST",
-        url="https://app.getorchestra.io/api/engine/public/pipelines/schema",
-        json={"ok": True},
-        status_code=200,
-    )
     import subprocess
 
     # repo root ok, but cannot get remote url or default branch
@@ -206,7 +183,7 @@ def test_missing_repo_or_branch(monkeypatch, tmp_path: Path, httpx_mock: HTTPXMo
         ("remote", "get-url", "origin"): (1, "", ""),
         ("symbolic-ref", "refs/remotes/origin/HEAD"): (1, "", ""),
         ("remote", "show", "origin"): (0, "", ""),
-        ("status", "--porcelain"): (0, "", ""),
+        ("diff-index", "--quiet", "HEAD", "--"): (0, "", ""),
     }
     monkeypatch.setattr(subprocess, "run", make_git_subprocess_mock(mapping))
 
@@ -215,17 +192,12 @@ def test_missing_repo_or_branch(monkeypatch, tmp_path: Path, httpx_mock: HTTPXMo
     assert "Could not detect repository URL from git" in result.output
 
 
+@pytest.mark.usefixtures("schema_ok")
 def test_warnings_printed(monkeypatch, tmp_path: Path, httpx_mock: HTTPXMock):
     repo_root = tmp_path
     f = repo_root / "p.yaml"
     f.write_text("name: ok\n")
 
-    httpx_mock.add_response(
-        method="POST",
-        url="https://app.getorchestra.io/api/engine/public/pipelines/schema",
-        json={"ok": True},
-        status_code=200,
-    )
     httpx_mock.add_response(
         method="POST",
         url="https://app.getorchestra.io/api/engine/public/pipelines/import",
@@ -248,7 +220,10 @@ def test_warnings_printed(monkeypatch, tmp_path: Path, httpx_mock: HTTPXMock):
         ("remote", "get-url", "origin"): (0, "git@github.com:org/repo.git", ""),
         ("symbolic-ref", "refs/remotes/origin/HEAD"): (0, "refs/remotes/origin/main", ""),
         ("rev-parse", "--abbrev-ref", "HEAD"): (0, "some-branch", ""),
-        ("status", "--porcelain"): (0, " M p.yaml\n", ""),
+        # Tracked files clean, but the imported YAML itself is untracked; the
+        # dirty warning must still fire.
+        ("diff-index", "--quiet", "HEAD", "--"): (0, "", ""),
+        ("ls-files", "--others", "--exclude-standard"): (0, "p.yaml", ""),
         ("rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}"): (0, "origin/main", ""),
         ("rev-parse", "HEAD"): (0, "aaaa", ""),
         ("rev-parse", "@{u}"): (0, "bbbb", ""),
@@ -1,6 +1,5 @@
 from pathlib import Path
 
-import pytest
 from pytest_httpx import HTTPXMock
 from typer.testing import CliRunner
 
@@ -12,18 +11,12 @@ mock_pipeline_run_id = "798d7121-6809-4148-aecb-26740cfabdf1"
 mock_api_key = "fake-key"
 
 
-@pytest.fixture(autouse=True)
-def mock_env(monkeypatch):
-    monkeypatch.setenv("ORCHESTRA_API_KEY", mock_api_key)
-    monkeypatch.setenv("BASE_URL", "")
-
-
 def test_run_success_simple(httpx_mock: HTTPXMock, monkeypatch, tmp_path: Path):
     # Mock git repo to trigger no warnings
     repo_root = tmp_path
     mapping = {
         ("rev-parse", "--show-toplevel"): (0, str(repo_root), ""),
-        ("status", "--porcelain"): (0, "", ""),
+        ("diff-index", "--quiet", "HEAD", "--"): (0, "", ""),
         ("rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}"): (1, "", ""),
     }
     import subprocess
@@ -50,7 +43,7 @@ def test_run_with_branch_commit(httpx_mock: HTTPXMock, monkeypatch, tmp_path: Pa
     repo_root = tmp_path
     mapping = {
         ("rev-parse", "--show-toplevel"): (0, str(repo_root), ""),
-        ("status", "--porcelain"): (0, "", ""),
+        ("diff-index", "--quiet", "HEAD", "--"): (0, "", ""),
         ("rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}"): (1, "", ""),
     }
     import subprocess
@@ -91,7 +84,7 @@ def test_run_warnings_prompt(httpx_mock: HTTPXMock, monkeypatch, tmp_path: Path)
     repo_root = tmp_path
     mapping = {
         ("rev-parse", "--show-toplevel"): (0, str(repo_root), ""),
-        ("status", "--porcelain"): (0, " M file.txt\n", ""),
+        ("diff-index", "--quiet", "HEAD", "--"): (1, "", ""),
         ("rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}"): (0, "origin/main", ""),
         ("rev-parse", "HEAD"): (0, "aaaa", ""),
         ("rev-parse", "@{u}"): (0, "bbbb", ""),
@@ -124,7 +117,7 @@ def test_run_api_error(httpx_mock: HTTPXMock, monkeypatch, tmp_path: Path):
     repo_root = tmp_path
     mapping = {
         ("rev-parse", "--show-toplevel"): (0, str(repo_root), ""),
-        ("status", "--porcelain"): (0, "", ""),
+        ("diff-index", "--quiet", "HEAD", "--"): (0, "", ""),
         ("rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}"): (1, "", ""),
     }
     import subprocess
@@ -149,7 +142,7 @@ def test_run_wait_success(httpx_mock: HTTPXMock, monkeypatch, tmp_path: Path):
     repo_root = tmp_path
     mapping = {
         ("rev-parse", "--show-toplevel"): (0, str(repo_root), ""),
-        ("status", "--porcelain"): (0, "", ""),
+        ("diff-index", "--quiet", "HEAD", "--"): (0, "", ""),
         ("rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}"): (1, "", ""),
     }
     import subprocess
@@ -197,7 +190,7 @@ def test_run_wait_failed(httpx_mock: HTTPXMock, monkeypatch, tmp_path: Path):
     repo_root = tmp_path
     mapping = {
         ("rev-parse", "--show-toplevel"): (0, str(repo_root), ""),
-        ("status", "--porcelain"): (0, "", ""),
+        ("diff-index", "--quiet", "HEAD", "--"): (0, "", ""),
         ("rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}"): (1, "", ""),
     }
     import subprocess
@@ -236,7 +229,7 @@ def test_run_wait_warning(httpx_mock: HTTPXMock, monkeypatch, tmp_path: Path):
     repo_root = tmp_path
     mapping = {
         ("rev-parse", "--show-toplevel"): (0, str(repo_root), ""),
-        ("status", "--porcelain"): (0, "", ""),
+        ("diff-index", "--quiet", "HEAD", "--"): (0, "", ""),
         ("rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}"): (1, "", ""),
     }
     import subprocess
@@ -9,22 +9,23 @@ from orchestra_cli.src.cli import app
 runner = CliRunner()
 
 
-@pytest.fixture(autouse=True)
-def mock_env(monkeypatch):
-    monkeypatch.setenv("ORCHESTRA_API_KEY", "fake-key")
-    monkeypatch.setenv("BASE_URL", "")
-
-
-def test_update_success_default_no_publish(tmp_path: Path, httpx_mock: HTTPXMock):
-    yaml_file = tmp_path / "pipe.yaml"
-    yaml_file.write_text("name: demo\nversion: 1\n")
-
-    httpx_mock.add_response(
-        method="POST",
-        url="https://app.getorchestra.io/api/engine/public/pipelines/schema",
-        json={"ok": True},
-        status_code=200,
-    )
+# One parametrized success test covers both publish modes and both spellings
+# (noun/verb and legacy alias).
+@pytest.mark.parametrize(
+    ("command", "flags", "published"),
+    [
+        (["pipeline", "update"], [], False),
+        (["update-pipeline"], ["--publish"], True),
+    ],
+)
+@pytest.mark.usefixtures("schema_ok")
+def test_update_success(
+    demo_yaml: Path,
+    httpx_mock: HTTPXMock,
+    command: list[str],
+    flags: list[str],
+    published: bool,
+):
     httpx_mock.add_response(
         method="PUT",
         url="https://app.getorchestra.io/api/engine/public/pipelines/demo",
@@ -32,71 +33,34 @@ def test_update_success_default_no_publish(tmp_path: Path, httpx_mock: HTTPXMock
         status_code=200,
         match_json={
             "data": {"name": "demo", "version": 1},
-            "published": False,
-            "storage_provider": "ORCHESTRA",
-        },
-    )
-
-    result = runner.invoke(app, ["pipeline", "update", "--alias", "demo", "--path", str(yaml_file)])
-    assert result.exit_code == 0
-    assert "updated successfully" in result.output
-    assert "https://app.getorchestra.io/pipelines/pipeline-id/edit" in result.output
-
-
-def test_update_publish_flag(tmp_path: Path, httpx_mock: HTTPXMock):
-    yaml_file = tmp_path / "pipe.yaml"
-    yaml_file.write_text("name: demo\nversion: 1\n")
-
-    httpx_mock.add_response(
-        method="POST",
-        url="https://app.getorchestra.io/api/engine/public/pipelines/schema",
-        json={"ok": True},
-        status_code=200,
-    )
-    httpx_mock.add_response(
-        method="PUT",
-        url="https://app.getorchestra.io/api/engine/public/pipelines/demo",
-        json={"id": "pipeline-id"},
-        status_code=200,
-        match_json={
-            "data": {"name": "demo", "version": 1},
-            "published": True,
+            "published": published,
             "storage_provider": "ORCHESTRA",
         },
     )
 
     result = runner.invoke(
         app,
-        ["update-pipeline", "--alias", "demo", "--path", str(yaml_file), "--publish"],
+        [*command, "--alias", "demo", "--path", str(demo_yaml), *flags],
     )
     assert result.exit_code == 0
     assert "updated successfully" in result.output
     assert "https://app.getorchestra.io/pipelines/pipeline-id/edit" in result.output
 
 
-def test_update_missing_api_key(monkeypatch, tmp_path: Path):
-    yaml_file = tmp_path / "pipe.yaml"
-    yaml_file.write_text("name: demo\n")
-
+def test_update_missing_api_key(monkeypatch, demo_yaml: Path):
     monkeypatch.delenv("ORCHESTRA_API_KEY", raising=False)
-    result = runner.invoke(app, ["pipeline", "update", "--alias", "demo", "--path", str(yaml_file)])
+    result = runner.invoke(app, ["pipeline", "update", "--alias", "demo", "--path", str(demo_yaml)])
     assert result.exit_code == 1
     assert "ORCHESTRA_API_KEY is not set" in result.output
 
 
-def test_update_invalid_yaml(tmp_path: Path):
-    bad = tmp_path / "bad.yaml"
-    bad.write_text("name: [oops\n")
-
-    result = runner.invoke(app, ["pipeline", "update", "--alias", "demo", "--path", str(bad)])
+def test_update_invalid_yaml(bad_yaml: Path):
+    result = runner.invoke(app, ["pipeline", "update", "--alias", "demo", "--path", str(bad_yaml)])
     assert result.exit_code == 1
     assert "Invalid YAML" in result.output
 
 
-def test_update_schema_validation_error(tmp_path: Path, httpx_mock: HTTPXMock):
-    yaml_file = tmp_path / "pipe.yaml"
-    yaml_file.write_text("name: demo\nversion: 1\n")
-
+def test_update_schema_validation_error(demo_yaml: Path, httpx_mock: HTTPXMock):
     httpx_mock.add_response(
         method="POST",
         url="https://app.getorchestra.io/api/engine/public/pipelines/schema",
@@ -104,21 +68,13 @@ def test_update_schema_validation_error(tmp_path: Path, httpx_mock: HTTPXMock):
         status_code=400,
     )
 
-    result = runner.invoke(app, ["pipeline", "update", "--alias", "demo", "--path", str(yaml_file)])
+    result = runner.invoke(app, ["pipeline", "update", "--alias", "demo", "--path", str(demo_yaml)])
     assert result.exit_code == 1
     assert "Validation failed" in result.output
 
 
-def test_update_api_error_orchestra_backed_only(tmp_path: Path, httpx_mock: HTTPXMock):
-    yaml_file = tmp_path / "pipe.yaml"
-    yaml_file.write_text("name: demo\nversion: 1\n")
-
-    httpx_mock.add_response(
-        method="POST",
-        url="https://app.getorchestra.io/api/engine/public/pipelines/schema",
-        json={"ok": True},
-        status_code=200,
-    )
+@pytest.mark.usefixtures("schema_ok")
+def test_update_api_error_orchestra_backed_only(demo_yaml: Path, httpx_mock: HTTPXMock):
     httpx_mock.add_response(
         method="PUT",
         url="https://app.getorchestra.io/api/engine/public/pipelines/demo",
@@ -126,22 +82,14 @@ def test_update_api_error_orchestra_backed_only(tmp_path: Path, httpx_mock: HTTP
         status_code=400,
     )
 
-    result = runner.invoke(app, ["pipeline", "update", "--alias", "demo", "--path", str(yaml_file)])
+    result = runner.invoke(app, ["pipeline", "update", "--alias", "demo", "--path", str(demo_yaml)])
     assert result.exit_code == 1
     assert "Update failed" in result.output
     assert "Only orchestra-backed pipelines can be updated via this endpoint." in result.output
 
 
-def test_update_success_without_pipeline_id_fails(tmp_path: Path, httpx_mock: HTTPXMock):
-    yaml_file = tmp_path / "pipe.yaml"
-    yaml_file.write_text("name: demo\nversion: 1\n")
-
-    httpx_mock.add_response(
-        method="POST",
-        url="https://app.getorchestra.io/api/engine/public/pipelines/schema",
-        json={"ok": True},
-        status_code=200,
-    )
+@pytest.mark.usefixtures("schema_ok")
+def test_update_success_without_pipeline_id_fails(demo_yaml: Path, httpx_mock: HTTPXMock):
     httpx_mock.add_response(
         method="PUT",
         url="https://app.getorchestra.io/api/engine/public/pipelines/demo",
@@ -149,21 +97,13 @@ def test_update_success_without_pipeline_id_fails(tmp_path: Path, httpx_mock: HT
         status_code=200,
     )
 
-    result = runner.invoke(app, ["pipeline", "update", "--alias", "demo", "--path", str(yaml_file)])
+    result = runner.invoke(app, ["pipeline", "update", "--alias", "demo", "--path", str(demo_yaml)])
     assert result.exit_code == 1
     assert "success response did not include pipeline id" in result.output
 
 
-def test_update_success_with_invalid_json_fails(tmp_path: Path, httpx_mock: HTTPXMock):
-    yaml_file = tmp_path / "pipe.yaml"
-    yaml_file.write_text("name: demo\nversion: 1\n")
-
-    httpx_mock.add_response(
-        method="POST",
-        url="https://app.getorchestra.io/api/engine/public/pipelines/schema",
-        json={"ok": True},
-        status_code=200,
-    )
+@pytest.mark.usefixtures("schema_ok")
+def test_update_success_with_invalid_json_fails(demo_yaml: Path, httpx_mock: HTTPXMock):
     httpx_mock.add_response(
         method="PUT",
         url="https://app.getorchestra.io/api/engine/public/pipelines/demo",
@@ -171,6 +111,6 @@ def test_update_success_with_invalid_json_fails(tmp_path: Path, httpx_mock: HTTP
         status_code=200,
     )
 
-    result = runner.invoke(app, ["pipeline", "update", "--alias", "demo", "--path", str(yaml_file)])
+    result = runner.invoke(app, ["pipeline", "update", "--alias", "demo", "--path", str(demo_yaml)])
     assert result.exit_code == 1
     assert "success response was not valid JSON" in result.output
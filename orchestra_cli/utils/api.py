@@ -6,18 +6,119 @@ construct ``Authorization`` headers, wrap ``httpx`` calls in ``try/except`` for
 transport errors, or hand-roll JSON-vs-text error rendering themselves.
 """
 
+import atexit
+import functools
 import json
 import os
 from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
-import httpx
 import typer
 
 from .styling import indent_message, red, yellow
 
+if TYPE_CHECKING:
+    import httpx
 
+_client: "httpx.Client | None" = None
+
+
+def get_client() -> "httpx.Client":
+    """Return the process-wide ``httpx.Client``, creating it on first use.
+
+    Commands that talk to the API more than once per invocation (schema
+    validate followed by an upsert/import, or the run polling loop) reuse one
+    pooled keep-alive connection instead of paying a fresh TCP+TLS handshake
+    per request. The client is closed at interpreter exit.
+    """
+    global _client
+    if _client is None:
+        import httpx
+
+        # HTTP/2 lets the validate + upsert request pair share one multiplexed
+        # connection; httpx already negotiates gzip/deflate response
+        # compression on its own. Fall back to HTTP/1.1 if the h2 extra is
+        # missing (e.g. installed without `httpx[http2]`).
+        limits = httpx.Limits(max_keepalive_connections=10)
+        try:
+            _client = httpx.Client(http2=True, timeout=30, limits=limits)
+        except ImportError:
+            _client = httpx.Client(timeout=30, limits=limits)
+        atexit.register(_client.close)
+    return _client
+
+
+@functools.cache
+def _orjson():
+    """Resolve ``orjson`` once per process, or ``None`` when unavailable.
+
+    Mirrors the cached-loader pattern in ``yaml_loader``: the C encoder is
+    preferred, the stdlib ``json`` module stays as a fallback so a missing
+    wheel never breaks the CLI.
+    """
+    try:
+        import orjson
+
+        return orjson
+    except ImportError:
+        return None
+
+
+_JSON_CONTENT = {"Content-Type": "application/json"}
+
+# Cap on how much of an error response body gets rendered to the terminal.
+_MAX_ERROR_BODY_BYTES = 1_000_000
+
+
+def encode_json(obj: object) -> bytes:
+    """Serialize a request payload to JSON bytes with the fastest encoder available.
+
+    Passing the result as ``content=`` (with ``json_content_headers``) lets
+    httpx skip its internal stdlib ``json.dumps`` on every POST.
+    """
+    orjson = _orjson()
+    if orjson is not None:
+        # YAML happily yields bool/int mapping keys (`on:`, `1:`); match the
+        # stdlib encoder's key coercion instead of rejecting such payloads.
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def json_content_headers(headers: dict[str, str] | None = None) -> dict[str, str]:
+    """Return ``headers`` extended with the JSON ``Content-Type`` header."""
+    if headers is None:
+        return _JSON_CONTENT
+    return {**headers, **_JSON_CONTENT}
+
+
+def parse_json(response: "httpx.Response") -> Any:
+    """Decode a JSON response body with the fastest decoder available.
+
+    Equivalent to ``response.json()`` but routed through orjson when
+    installed; use on happy paths where the body is known to be JSON.
+    """
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def dump_json_indented(obj: object) -> str:
+    """Render an object as 2-space-indented JSON for terminal display."""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+@functools.cache
 def require_api_key() -> str:
-    """Return ``ORCHESTRA_API_KEY`` from the environment or exit with code 1."""
+    """Return ``ORCHESTRA_API_KEY`` from the environment or exit with code 1.
+
+    Cached: the key cannot change mid-process, so repeat callers skip the
+    env lookup. Only the success case sticks - ``functools.cache`` does not
+    memoize the raised exit, so a later call re-checks the environment.
+    """
     api_key = os.getenv("ORCHESTRA_API_KEY")
     if not api_key:
         typer.echo(red("ORCHESTRA_API_KEY is not set"))
@@ -25,20 +126,24 @@ def require_api_key() -> str:
     return api_key
 
 
+@functools.lru_cache(maxsize=8)
 def auth_headers(api_key: str) -> dict[str, str]:
+    # Callers treat the result as read-only (copies are made where headers
+    # get merged), so one dict per key is safe to share.
     return {"Authorization": f"Bearer {api_key}"}
 
 
 def request_or_exit(
-    httpx_func: Callable[..., httpx.Response],
+    httpx_func: "Callable[..., httpx.Response]",
     *args: object,
     **kwargs: object,
-) -> httpx.Response:
+) -> "httpx.Response":
     """Invoke an ``httpx`` request function, exiting cleanly on transport errors.
 
-    Takes the ``httpx`` callable (e.g. ``httpx.post``) rather than a method
-    string so existing tests can still ``monkeypatch.setattr(httpx, "delete", ...)``
-    to simulate transport failures.
+    Takes the request callable (normally a bound method of the shared client,
+    e.g. ``get_client().post``) so commands stay free of transport try/except
+    blocks. Callers that pre-encode a payload pass a zero-argument closure so
+    serialization errors are handled the same way.
     """
     try:
         return httpx_func(*args, **kwargs)
@@ -47,18 +152,31 @@ def request_or_exit(
         raise typer.Exit(code=1)
 
 
-def echo_response_error_body(response: httpx.Response) -> None:
-    """Echo a response body as indented JSON if possible, falling back to text."""
-    try:
-        typer.echo(yellow(indent_message(json.dumps(response.json(), indent=2))))
+def echo_response_error_body(response: "httpx.Response") -> None:
+    """Echo a response body as indented JSON if possible, falling back to text.
+
+    The content type decides the rendering up front so the body is decoded
+    once, not parsed speculatively and then re-decoded as text on failure.
+    Bodies beyond ``_MAX_ERROR_BODY_BYTES`` are truncated instead of being
+    parsed and echoed wholesale, so a misbehaving server cannot flood the
+    terminal or burn memory on indentation of a huge payload.
+    """
+    if len(response.content) > _MAX_ERROR_BODY_BYTES:
+        head = response.content[:_MAX_ERROR_BODY_BYTES].decode("utf-8", "replace")
+        typer.echo(yellow(indent_message(head + "... [truncated]")))
         return
-    except Exception:
-        pass
+    content_type = response.headers.get("content-type", "")
+    if content_type.startswith("application/json"):
+        try:
+            typer.echo(yellow(indent_message(dump_json_indented(response.json()))))
+            return
+        except Exception:
+            pass
     if response.text:
         typer.echo(yellow(indent_message(response.text)))
 
 
-def fail_with_response(action: str, response: httpx.Response) -> None:
+def fail_with_response(action: str, response: "httpx.Response") -> None:
     """Echo a uniform ``❌ <action> failed with status <code>`` error and exit 1."""
     typer.echo(red(f"❌ {action} failed with status {response.status_code}"))
     echo_response_error_body(response)
@@ -1,17 +1,25 @@
+import functools
 import os
 
 _PROD_BASE_URL = "https://app.getorchestra.io"
 
+# URL helpers are memoized: BASE_URL cannot change mid-process, and commands
+# that loop (run polling, batch scripts invoking several helpers) re-request
+# the same handful of URLs.
 
+
+@functools.lru_cache(maxsize=128)
 def get_api_url(path: str) -> str:
     suffix = f"/{path.lstrip('/')}" if path else ""
     return f"{get_base_url()}/api/engine/public/pipelines{suffix}"
 
 
+@functools.cache
 def get_base_url() -> str:
     return (os.getenv("BASE_URL") or _PROD_BASE_URL).strip().rstrip("/")
 
 
+@functools.lru_cache(maxsize=128)
 def get_public_api_url(path: str) -> str:
     return f"{get_base_url()}/api/engine/public/{path.lstrip('/')}"
 
@@ -28,5 +36,14 @@ def get_delete_pipeline_url(alias: str) -> str:
     return get_api_url(alias)
 
 
+@functools.lru_cache(maxsize=128)
 def get_pipeline_edit_url(pipeline_id: str) -> str:
     return f"{get_base_url()}/pipelines/{pipeline_id}/edit"
+
+
+def clear_url_caches() -> None:
+    """Reset memoized URLs. Tests change BASE_URL between cases."""
+    get_api_url.cache_clear()
+    get_base_url.cache_clear()
+    get_public_api_url.cache_clear()
+    get_pipeline_edit_url.cache_clear()
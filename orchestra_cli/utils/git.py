@@ -1,21 +1,56 @@
+import functools
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
-def run_git_command(args: list[str], cwd: Path) -> tuple[bool, str]:
+@functools.lru_cache(maxsize=64)
+def _run_git_command_cached(args: tuple[str, ...], cwd: str) -> tuple[int, str, str]:
     try:
+        # Bytes mode: text=True resolves the preferred locale encoding on
+        # first use, and git output for these plumbing commands is UTF-8
+        # regardless of locale, so decode explicitly instead.
         result = subprocess.run(
             ["git", *args],
-            cwd=str(cwd),
+            cwd=cwd,
             capture_output=True,
-            text=True,
             check=False,
         )
-        if result.returncode == 0:
-            return True, result.stdout.strip()
-        return False, result.stderr.strip() or result.stdout.strip()
+        stdout = result.stdout.decode("utf-8", "replace").strip()
+        stderr = result.stderr.decode("utf-8", "replace").strip()
+        return result.returncode, stdout, stderr
     except Exception as e:
-        return False, str(e)
+        return -1, "", str(e)
+
+
+def run_git_command(args: list[str], cwd: Path) -> tuple[bool, str]:
+    """Run ``git <args>`` in ``cwd`` and return ``(ok, output)``.
+
+    Results are cached per ``(args, cwd)`` for the life of the process: the
+    CLI is one-shot, and several detection helpers ask git the same question
+    (e.g. the origin URL), so each distinct command forks at most once.
+    """
+    returncode, stdout, stderr = _run_git_command_cached(tuple(args), str(cwd))
+    if returncode == 0:
+        return True, stdout
+    return False, stderr or stdout
+
+
+def clear_git_cache() -> None:
+    """Reset cached git results. Tests re-mock ``subprocess.run`` per case."""
+    _run_git_command_cached.cache_clear()
+
+
+def prefetch_git_commands(commands: list[list[str]], cwd: Path) -> None:
+    """Warm the git result cache by running independent commands concurrently.
+
+    The commands have no data dependency on each other, so their fork+exec
+    and git startup costs are overlapped; callers then read the memoized
+    results through ``run_git_command`` in whatever order their logic needs.
+    """
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        for _ in pool.map(lambda args: run_git_command(args, cwd), commands):
+            pass
 
 
 def detect_repo_root(start_path: Path) -> Path | None:
@@ -26,10 +61,33 @@ def detect_repo_root(start_path: Path) -> Path | None:
 
 
 def git_warnings(repo_root: Path) -> list[str]:
+    # The dirty check and the upstream lookups have no ordering dependency;
+    # warm the cache concurrently so the warning pass costs roughly one git
+    # exec of wall time instead of four. Already-cached entries are no-ops.
+    prefetch_git_commands(
+        [
+            ["diff-index", "--quiet", "HEAD", "--"],
+            ["ls-files", "--others", "--exclude-standard"],
+            ["rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}"],
+            ["rev-parse", "HEAD"],
+            ["rev-parse", "@{u}"],
+        ],
+        repo_root,
+    )
     warnings: list[str] = []
-    # Uncommitted changes
-    ok, out = run_git_command(["status", "--porcelain"], repo_root)
-    if ok and out:
+    # Uncommitted changes: `diff-index --quiet` answers for tracked files via
+    # its exit code (0 clean, 1 dirty) without formatting per-file status
+    # output the way `status --porcelain` does; it sees nothing untracked, so
+    # pair it with an `ls-files --others` probe for new files.
+    returncode, _, _ = _run_git_command_cached(
+        ("diff-index", "--quiet", "HEAD", "--"),
+        str(repo_root),
+    )
+    ok_untracked, untracked = run_git_command(
+        ["ls-files", "--others", "--exclude-standard"],
+        repo_root,
+    )
+    if returncode == 1 or (ok_untracked and untracked):
         warnings.append("Uncommitted changes detected in repository")
 
     # Not on latest commit of the branch / local vs remote mismatch
@@ -5,31 +5,101 @@ Shared by every command that takes a ``--path`` to a YAML file. Keeping it in
 command having to import private functions from another.
 """
 
+import functools
+import hashlib
 import json
+import os
 from pathlib import Path
 
-import httpx
 import typer
-import yaml
 
+from .api import dump_json_indented, encode_json, get_client, json_content_headers
 from .constants import get_api_url
 from .styling import indent_message, red, yellow
 
 
+@functools.cache
+def _yaml_loader():
+    """Resolve the fastest available safe loader once per process.
+
+    ``CSafeLoader`` (libyaml) parses an order of magnitude faster than the
+    pure-Python ``SafeLoader`` that ``yaml.safe_load`` uses; fall back only
+    when PyYAML was built without libyaml.
+    """
+    try:
+        from yaml import CSafeLoader
+
+        return CSafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
+        return SafeLoader
+
+
 def load_yaml(file: Path) -> tuple[dict | None, str | None]:
     """Read a YAML file and return ``(data, None)`` or ``(None, error_message)``."""
     try:
-        with file.open("r") as f:
-            data = yaml.safe_load(f)
+        # Read in one go rather than letting the loader pull from the file
+        # object - avoids per-read callbacks into Python on large files.
+        raw = file.read_bytes()
+    except Exception as e:
+        return None, str(e)
+    return _parse_yaml_bytes(raw)
+
+
+def _parse_yaml_bytes(raw: bytes) -> tuple[dict | None, str | None]:
+    """Parse YAML bytes; ``yaml`` is imported here rather than at module scope
+    so that commands which exit before touching the file (e.g. on a missing
+    API key) never pay for it. Bytes input keeps libyaml on its UTF-8 fast
+    path instead of re-encoding an already-decoded str."""
+    import yaml
+
+    try:
+        data = yaml.load(raw, Loader=_yaml_loader())
         return data, None
     except Exception as e:
         return None, str(e)
 
 
+def _validation_cache_dir() -> Path:
+    """Directory holding parsed+validated YAML results, keyed by content hash.
+
+    ``ORCHESTRA_CACHE_DIR`` overrides the default so tests (and users who
+    want a cold run) can point it elsewhere.
+    """
+    override = os.getenv("ORCHESTRA_CACHE_DIR")
+    if override:
+        return Path(override)
+    return Path.home() / ".cache" / "orchestra" / "yaml"
+
+
+def _read_validation_cache(digest: str) -> dict | None:
+    try:
+        cached = json.loads((_validation_cache_dir() / f"{digest}.json").read_bytes())
+    except Exception:
+        return None
+    return cached if isinstance(cached, dict) else None
+
+
+def _write_validation_cache(digest: str, data: dict) -> None:
+    # Best effort: a read-only home directory must not break the command.
+    try:
+        cache_dir = _validation_cache_dir()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / f"{digest}.json").write_bytes(encode_json(data))
+    except Exception:
+        pass
+
+
 def validate_yaml_with_api(data: dict) -> tuple[bool, str | None]:
     """POST a YAML payload to the schema endpoint and return ``(ok, err_message)``."""
     try:
-        response = httpx.post(get_api_url("schema"), json=data, timeout=15)
+        response = get_client().post(
+            get_api_url("schema"),
+            content=encode_json(data),
+            headers=json_content_headers(),
+            timeout=15,
+        )
     except Exception as e:
         return False, f"HTTP request failed: {e}"
 
@@ -37,18 +107,35 @@ def validate_yaml_with_api(data: dict) -> tuple[bool, str | None]:
         return True, None
     try:
         errors = response.json()
-        return False, json.dumps(errors, indent=2)
+        return False, dump_json_indented(errors)
     except Exception:
         return False, response.text
 
 
 def load_validated_pipeline_data(path: Path) -> dict:
-    """Load YAML and run it through the schema endpoint, exiting cleanly on failure."""
+    """Load YAML and run it through the schema endpoint, exiting cleanly on failure.
+
+    Results are cached on disk by content hash: a file that is byte-identical
+    to one that previously passed validation skips both the YAML parse and
+    the schema round-trip. Any edit changes the hash, so the cache can never
+    serve stale data.
+    """
     if not path.exists():
         typer.echo(red(f"File not found: {path}"))
         raise typer.Exit(code=1)
 
-    data, err = load_yaml(path)
+    try:
+        raw = path.read_bytes()
+    except Exception as e:
+        typer.echo(red(f"Invalid YAML: {e}"))
+        raise typer.Exit(code=1)
+
+    digest = hashlib.sha1(raw).hexdigest()
+    cached = _read_validation_cache(digest)
+    if cached is not None:
+        return cached
+
+    data, err = _parse_yaml_bytes(raw)
     if err is not None:
         typer.echo(red(f"Invalid YAML: {err}"))
         raise typer.Exit(code=1)
@@ -60,4 +147,5 @@ def load_validated_pipeline_data(path: Path) -> dict:
             typer.echo(yellow(indent_message(err_msg)))
         raise typer.Exit(code=1)
 
+    _write_validation_cache(digest, data or {})
     return data or {}